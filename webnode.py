@@ -2,138 +2,90 @@
 import sys
 import os
 import re
-import requests
+import string
+import functools
+import inspect
+import time
+import hashlib
+import sqlite3
+from concurrent.futures import ThreadPoolExecutor
+import threading
 from urllib.parse import urlparse
+from html.parser import HTMLParser
 from PyQt5 import QtCore, QtGui, QtWidgets
-from PyQt5.QtWebEngineWidgets import QWebEngineView
-from PyQt5.QtCore import QUrl
-from bs4 import BeautifulSoup
+try:
+    import blake3
+except ImportError:
+    blake3 = None
+
+# Drop every ASCII character that is not safe in a filename
+_FILENAME_CHARS = set(string.ascii_letters + string.digits + "._-")
+_SANITIZE_XLAT = {c: None for c in range(128) if chr(c) not in _FILENAME_CHARS}
+_URL_RE = re.compile(r'^https?://')
+_DOC_RE = re.compile(r'doc', re.IGNORECASE)
 
 # ---------------------------
 # Custom Widgets (QSS GitHub-like)
 # ---------------------------
 
 class StyledLineEdit(QtWidgets.QLineEdit):
+    # GitHub-like QSS for input fields; Qt applies the pseudo-states itself
+    QSS = """
+    QLineEdit {
+        border: 1px solid #444c56;
+        border-radius: 3px;
+        background-color: #22272e;
+        color: #adbac7;
+        padding-left: 8px;
+        padding-right: 8px;
+        font-family: 'Roboto', Arial, sans-serif;
+    }
+    QLineEdit:hover, QLineEdit:focus {
+        border-color: #539bf5;
+        background-color: #2d333b;
+    }
+    """
+
     def __init__(self, *args, **kwargs):
         super().__init__(*args, **kwargs)
         self.setFixedHeight(32)
         self.setFont(QtGui.QFont("Roboto", 10))
         self.setContentsMargins(0, 0, 0, 0)
         self.setAttribute(QtCore.Qt.WA_MacShowFocusRect, False)
-        self.setStyleSheet(self._style("normal"))
+        self.setStyleSheet(self.QSS)
         self.setVisible(True)  # Ensure input is visible
 
-    def enterEvent(self, event):
-        self.setStyleSheet(self._style("hover"))
-        super().enterEvent(event)
-
-    def leaveEvent(self, event):
-        self.setStyleSheet(self._style("normal"))
-        super().leaveEvent(event)
-
-    def mousePressEvent(self, event):
-        self.setStyleSheet(self._style("pressed"))
-        super().mousePressEvent(event)
-
-    def mouseReleaseEvent(self, event):
-        self.setStyleSheet(self._style("hover"))
-        super().mouseReleaseEvent(event)
-
-    def focusInEvent(self, event):
-        self.setStyleSheet(self._style("hover"))
-        super().focusInEvent(event)
-
-    def focusOutEvent(self, event):
-        self.setStyleSheet(self._style("normal"))
-        super().focusOutEvent(event)
-
-    def _style(self, state):
-        # GitHub-like QSS for input fields
-        if state == "normal":
-            border = "#444c56"
-            bg = "#22272e"
-        elif state == "hover":
-            border = "#539bf5"
-            bg = "#2d333b"
-        elif state == "pressed":
-            border = "#316dca"
-            bg = "#1b1f23"
-        else:
-            border = "#444c56"
-            bg = "#22272e"
-        return f"""
-        QLineEdit {{
-            border: 1px solid {border};
-            border-radius: 3px;
-            background-color: {bg};
-            color: #adbac7;
-            padding-left: 8px;
-            padding-right: 8px;
-            font-family: 'Roboto', Arial, sans-serif;
-        }}
-        """
-
 class StyledButton(QtWidgets.QPushButton):
+    # GitHub-like QSS for buttons; Qt applies the pseudo-states itself
+    QSS = """
+    QPushButton {
+        border: 1px solid #444c56;
+        border-radius: 3px;
+        background-color: #2d333b;
+        color: #adbac7;
+        font-family: 'Roboto', Arial, sans-serif;
+    }
+    QPushButton:hover {
+        border-color: #539bf5;
+        background-color: #444c56;
+    }
+    QPushButton:pressed {
+        border-color: #316dca;
+        background-color: #22272e;
+    }
+    QPushButton:disabled {
+        color: #768390;
+        background-color: #22272e;
+    }
+    """
+
     def __init__(self, text, width=128, *args, **kwargs):
         super().__init__(text, *args, **kwargs)
         self.setFixedHeight(32)
         self.setFixedWidth(width)
         self.setFont(QtGui.QFont("Roboto", 10, QtGui.QFont.Bold))
         self.setCursor(QtCore.Qt.PointingHandCursor)
-        self.setStyleSheet(self._style("normal"))
-        self._state = "normal"
-
-    def enterEvent(self, event):
-        self.setStyleSheet(self._style("hover"))
-        self._state = "hover"
-        super().enterEvent(event)
-
-    def leaveEvent(self, event):
-        self.setStyleSheet(self._style("normal"))
-        self._state = "normal"
-        super().leaveEvent(event)
-
-    def mousePressEvent(self, event):
-        self.setStyleSheet(self._style("pressed"))
-        self._state = "pressed"
-        super().mousePressEvent(event)
-
-    def mouseReleaseEvent(self, event):
-        self.setStyleSheet(self._style("hover"))
-        self._state = "hover"
-        super().mouseReleaseEvent(event)
-
-    def _style(self, state):
-        # GitHub-like QSS for buttons
-        if state == "normal":
-            border = "#444c56"
-            bg = "#2d333b"
-            color = "#adbac7"
-        elif state == "hover":
-            border = "#539bf5"
-            bg = "#444c56"
-            color = "#adbac7"
-        elif state == "pressed":
-            border = "#316dca"
-            bg = "#22272e"
-            color = "#adbac7"
-        else:
-            border = "#444c56"
-            bg = "#2d333b"
-            color = "#adbac7"
-        return f"""
-        QPushButton {{
-            border: 1px solid {border};
-            border-radius: 3px;
-            background-color: {bg};
-            color: {color};
-            font-family: 'Roboto', Arial, sans-serif;
-        }}
-        QPushButton:disabled {{
-            color: #768390;
-            background-color: #22272e;
-        }}
-        """
+        self.setStyleSheet(self.QSS)
 
 # ---------------------------
 # Folder Handling
@@ -150,25 +102,27 @@ def get_documents_folder():
 
     # Try to find similar folders
     home = os.path.expanduser("~")
-    candidates = []
-    for name in os.listdir(home):
-        path = os.path.join(home, name)
-        if os.path.isdir(path) and re.search(r'doc', name, re.IGNORECASE):
-            candidates.append(path)
-    if candidates:
-        # Pick the one with the shortest name (most likely)
-        return sorted(candidates, key=lambda x: len(x))[0]
-    return None
-
+    best = None
+    with os.scandir(home) as it:
+        for entry in it:
+            # Match the name first: is_dir() may still need a stat for symlinks
+            if not _DOC_RE.search(entry.name) or not entry.is_dir():
+                continue
+            # Keep the one with the shortest name (most likely)
+            if best is None or len(entry.path) < len(best):
+                best = entry.path
+    return best
+
+@functools.lru_cache(maxsize=None)
 def get_webnode_apps_folder():
     doc_folder = get_documents_folder()
     if not doc_folder:
         return None
     wn_folder = os.path.join(doc_folder, "WebNode Apps")
-    if not os.path.exists(wn_folder):
-        os.makedirs(wn_folder, exist_ok=True)
+    os.makedirs(wn_folder, exist_ok=True)
     return wn_folder
 
+@functools.lru_cache(maxsize=256)
 def get_app_folder(base_folder, company, name):
     safe_company = sanitize_filename(company)
     safe_name = sanitize_filename(name)
@@ -180,45 +134,303 @@ def get_app_folder(base_folder, company, name):
 # Favicon Extraction
 # ---------------------------
 
-def get_favicon_url(url):
+# Shared HTTP session: the page and its favicon live on the same host,
+# so keep-alive lets the second request reuse the first connection.
+# Transient failures are retried a few times with exponential backoff
+# before get_favicon_url falls back to /favicon.ico.
+# requests is only imported on first use to keep startup fast.
+RETRY_AFTER_MAX = 5
+
+_session = None
+_session_lock = threading.Lock()
+
+def get_session():
+    global _session
+    with _session_lock:
+        if _session is None:
+            import requests
+            from requests.adapters import HTTPAdapter
+            from urllib3.util.retry import Retry
+
+            session = requests.Session()
+            session.headers.update({"User-Agent": "Mozilla/5.0"})
+            # Jitter and a capped Retry-After wait need urllib3 2.x; without
+            # the cap a server could stall the worker for hours, so
+            # Retry-After is only honoured when it can be bounded
+            retry_params = inspect.signature(Retry).parameters
+            retry_options = {}
+            if "backoff_jitter" in retry_params:
+                retry_options["backoff_jitter"] = 0.25
+            if "retry_after_max" in retry_params:
+                retry_options["retry_after_max"] = RETRY_AFTER_MAX
+            retry = Retry(
+                total=3,
+                backoff_factor=0.25,
+                status_forcelist=[429, 500, 502, 503, 504],
+                allowed_methods=["GET"],
+                respect_retry_after_header="retry_after_max" in retry_options,
+                **retry_options,
+            )
+            adapter = HTTPAdapter(pool_connections=10, pool_maxsize=20, max_retries=retry)
+            session.mount("https://", adapter)
+            session.mount("http://", adapter)
+            _session = session
+        return _session
+
+def close_session():
+    global _session
+    with _session_lock:
+        if _session is not None:
+            _session.close()
+            _session = None
+
+class _StopParsing(Exception):
+    pass
+
+class _HeadParser(HTMLParser):
+    # Collects <title> text and the first icon <link> href, then stops
+    def __init__(self):
+        super().__init__()
+        self.title = None
+        self.icon_href = None
+        self._title_parts = None
+
+    def handle_starttag(self, tag, attrs):
+        if tag == "title" and self.title is None:
+            self._title_parts = []
+        elif tag == "link" and self.icon_href is None:
+            attrs = dict(attrs)
+            rel = attrs.get("rel") or ""
+            if "icon" in rel.lower() and attrs.get("href"):
+                self.icon_href = attrs["href"]
+                if self.title is not None:
+                    raise _StopParsing
+        elif tag == "body":
+            raise _StopParsing
+
+    def handle_endtag(self, tag):
+        if tag == "title" and self._title_parts is not None:
+            self.title = "".join(self._title_parts).strip()
+            self._title_parts = None
+            if self.icon_href is not None:
+                raise _StopParsing
+        elif tag == "head":
+            raise _StopParsing
+
+    def handle_data(self, data):
+        if self._title_parts is not None:
+            self._title_parts.append(data)
+
+@functools.lru_cache(maxsize=128)
+def _url_base(url):
+    parsed = urlparse(url)
+    return f"{parsed.scheme}://{parsed.netloc}"
+
+def fetch_title_and_icon(url):
+    # Returns (page title, favicon URL); falls back to /favicon.ico
+    base = _url_base(url)
+    title = None
+    href = None
     try:
-        resp = requests.get(url, timeout=5, headers={"User-Agent": "Mozilla/5.0"})
-        soup = BeautifulSoup(resp.text, "html.parser")
-        icon_link = soup.find("link", rel=lambda x: x and "icon" in x.lower())
-        if icon_link and icon_link.get("href"):
-            href = icon_link["href"]
-            if href.startswith("http"):
-                return href
-            else:
-                parsed = urlparse(url)
-                base = f"{parsed.scheme}://{parsed.netloc}"
-                if href.startswith("/"):
-                    return base + href
-                else:
-                    return base + "/" + href
-        # fallback to /favicon.ico
-        parsed = urlparse(url)
-        return f"{parsed.scheme}://{parsed.netloc}/favicon.ico"
+        parser = _HeadParser()
+        # Stream the page and stop reading once the <head> is done
+        with get_session().get(url, timeout=5, stream=True) as resp:
+            if "charset" not in resp.headers.get("Content-Type", "").lower():
+                resp.encoding = "utf-8"
+            try:
+                for chunk in resp.iter_content(16384, decode_unicode=True):
+                    parser.feed(chunk)
+            except _StopParsing:
+                pass
+        title = parser.title
+        href = parser.icon_href
     except Exception:
-        # fallback to /favicon.ico
-        parsed = urlparse(url)
-        return f"{parsed.scheme}://{parsed.netloc}/favicon.ico"
+        pass
+    if not href:
+        return title, base + "/favicon.ico"
+    if href.startswith(("http://", "https://")):
+        return title, href
+    if href.startswith("/"):
+        return title, base + href
+    return title, base + "/" + href
+
+def get_favicon_url(url):
+    return fetch_title_and_icon(url)[1]
+
+def _remove_quietly(path):
+    try:
+        os.remove(path)
+    except OSError:
+        pass
+
+MAX_FAVICON_BYTES = 2 * 1024 * 1024
+_WRITE_FLAGS = os.O_WRONLY | os.O_CREAT | os.O_TRUNC | getattr(os, "O_BINARY", 0)
 
 def download_favicon(favicon_url, save_path):
     try:
-        resp = requests.get(favicon_url, timeout=5, headers={"User-Agent": "Mozilla/5.0"})
-        if resp.status_code == 200 and resp.content:
-            with open(save_path, "wb") as f:
-                f.write(resp.content)
-            return True
+        with get_session().get(favicon_url, timeout=5, stream=True) as resp:
+            if resp.status_code != 200:
+                return False
+            length = resp.headers.get("Content-Length")
+            if length and length.isdigit() and int(length) > MAX_FAVICON_BYTES:
+                return False
+            written = 0
+            # Download next to the target and swap it in only when complete;
+            # replacing (not truncating) also leaves hardlinked icons intact
+            tmp_path = save_path + ".tmp"
+            fd = os.open(tmp_path, _WRITE_FLAGS, 0o666)
+            done = False
+            try:
+                try:
+                    for chunk in resp.iter_content(65536):
+                        written += len(chunk)
+                        if written > MAX_FAVICON_BYTES:
+                            break
+                        # os.write may write less than asked; finish the chunk
+                        view = memoryview(chunk)
+                        while view:
+                            view = view[os.write(fd, view):]
+                finally:
+                    os.close(fd)
+                if 0 < written <= MAX_FAVICON_BYTES:
+                    os.replace(tmp_path, save_path)
+                    done = True
+            finally:
+                if not done:
+                    _remove_quietly(tmp_path)
+            return done
     except Exception:
         pass
     return False
 
+# ---------------------------
+# Favicon Cache
+# ---------------------------
+
+CACHE_FILENAME = "webnode_cache.sqlite"
+CACHE_TTL = 24 * 60 * 60
+
+def _hash_bytes(data):
+    if blake3 is not None:
+        return blake3.blake3(data).hexdigest()
+    return hashlib.blake2b(data).hexdigest()
+
+def _url_key(url):
+    # First 16 bytes of the digest
+    return _hash_bytes(url.encode("utf-8"))[:32]
+
+def open_cache(folder):
+    conn = sqlite3.connect(os.path.join(folder, CACHE_FILENAME))
+    conn.execute(
+        "CREATE TABLE IF NOT EXISTS cache ("
+        "url_hash TEXT PRIMARY KEY, favicon BLOB, favicon_url TEXT, "
+        "title TEXT, fetched_at REAL)"
+    )
+    conn.execute(
+        "CREATE TABLE IF NOT EXISTS icons ("
+        "content_hash TEXT PRIMARY KEY, path TEXT)"
+    )
+    return conn
+
+def write_atomic(path, data, mode="wb", encoding=None):
+    # Write to a sibling temp file, then rename it over path in one step
+    tmp_path = path + ".tmp"
+    try:
+        with open(tmp_path, mode, encoding=encoding, buffering=65536) as f:
+            f.write(data)
+        os.replace(tmp_path, path)
+    except BaseException:
+        _remove_quietly(tmp_path)
+        raise
+
+def _hash_file(path):
+    with open(path, "rb") as f:
+        return _hash_bytes(f.read())
+
+def _forget_icon_path(conn, path):
+    # path now holds new content; drop rows recorded for its old content
+    with conn:
+        conn.execute("DELETE FROM icons WHERE path = ?", (path,))
+
+def store_icon(conn, favicon, save_path, written=False):
+    # Hardlink save_path to an existing identical icon when there is one,
+    # otherwise write favicon there (unless already written) and record it
+    content_hash = _hash_bytes(favicon)
+    row = conn.execute(
+        "SELECT path FROM icons WHERE content_hash = ?", (content_hash,)
+    ).fetchone()
+    if row:
+        # The recorded file may have been rewritten since; only trust it
+        # if it still holds the same bytes
+        if os.path.isfile(row[0]) and _hash_file(row[0]) == content_hash:
+            if row[0] == save_path:
+                return
+            tmp_path = save_path + ".tmp"
+            try:
+                if os.path.lexists(tmp_path):
+                    os.remove(tmp_path)
+                os.link(row[0], tmp_path)
+                os.replace(tmp_path, save_path)
+                _forget_icon_path(conn, save_path)
+                return
+            except OSError:
+                # Cross-device or no hardlink support; keep a plain copy
+                _remove_quietly(tmp_path)
+        else:
+            with conn:
+                conn.execute(
+                    "DELETE FROM icons WHERE content_hash = ?", (content_hash,)
+                )
+    if not written or not os.path.exists(save_path):
+        write_atomic(save_path, favicon)
+    _forget_icon_path(conn, save_path)
+    with conn:
+        conn.execute(
+            "INSERT OR REPLACE INTO icons VALUES (?, ?)", (content_hash, save_path)
+        )
+
+def fetch_favicon(url, save_path, cache_folder=None):
+    # Serve from the on-disk cache when fresh, otherwise fetch and store.
+    # The favicon is best-effort: a broken cache falls back to a plain fetch.
+    if cache_folder is not None:
+        try:
+            return _fetch_favicon_cached(url, save_path, cache_folder)
+        except (sqlite3.Error, OSError):
+            pass
+    return download_favicon(get_favicon_url(url), save_path)
+
+def _fetch_favicon_cached(url, save_path, cache_folder):
+    key = _url_key(url)
+    conn = open_cache(cache_folder)
+    try:
+        row = conn.execute(
+            "SELECT favicon, fetched_at FROM cache WHERE url_hash = ?", (key,)
+        ).fetchone()
+        if row and row[0] and time.time() - row[1] < CACHE_TTL:
+            store_icon(conn, row[0], save_path)
+            return True
+
+        title, favicon_url = fetch_title_and_icon(url)
+        if not download_favicon(favicon_url, save_path):
+            return False
+        with open(save_path, "rb") as f:
+            favicon = f.read()
+        store_icon(conn, favicon, save_path, written=True)
+        with conn:
+            conn.execute(
+                "INSERT OR REPLACE INTO cache VALUES (?, ?, ?, ?, ?)",
+                (key, favicon, favicon_url, title, time.time()),
+            )
+        return True
+    finally:
+        conn.close()
+
 # ---------------------------
 # Script Generation Logic
 # ---------------------------
 
+_FETCH_POOL = ThreadPoolExecutor(max_workers=4, thread_name_prefix="webnode-fetch")
+
 SCRIPT_TEMPLATE = '''import sys
 import os
 from PyQt5 import QtWidgets, QtGui
@@ -243,13 +455,33 @@ if __name__ == "__main__":
     main()
 '''
 
+# Template pre-split once; rendering is then plain string concatenation
+_TEMPLATE_PARTS = list(string.Formatter().parse(SCRIPT_TEMPLATE))
+assert [part[1] for part in _TEMPLATE_PARTS] == ["title", "icon_path", "url", None]
+_PART0, _PART1, _PART2, _PART3 = (part[0] for part in _TEMPLATE_PARTS)
+
+_TITLE_XLAT = str.maketrans({'"': '\\"'})
+_PATH_XLAT = str.maketrans({"\\": "\\\\", '"': '\\"'})
+
+def escape_title(title):
+    return title.translate(_TITLE_XLAT)
+
+def escape_path(path):
+    return path.translate(_PATH_XLAT)
+
+def render_script(title, url, icon_path):
+    # Arguments are the already-escaped substitutions
+    return _PART0 + title + _PART1 + icon_path + _PART2 + url + _PART3
+
 def sanitize_filename(s):
     # Remove problematic characters for filenames
-    return re.sub(r'[^a-zA-Z0-9._-]', '', s)
+    if not s.isascii():
+        s = s.encode("ascii", "ignore").decode("ascii")
+    return s.translate(_SANITIZE_XLAT)
 
 def validate_url(url):
     # Basic validation for http(s) URLs
-    return re.match(r'^https?://', url.strip())
+    return _URL_RE.match(url.strip())
 
 def generate_script(company, name, title, url, folder):
     safe_company = sanitize_filename(company)
@@ -259,20 +491,45 @@ def generate_script(company, name, title, url, folder):
     icon_filename = f"webnode.{safe_company}.{safe_name}.ico"
     script_path = os.path.join(app_folder, filename)
     icon_path = os.path.join(app_folder, icon_filename)
+    if not os.path.isdir(app_folder):
+        # The cached app folder was removed since it was first created;
+        # recreate it before the favicon worker starts writing into it
+        get_app_folder.cache_clear()
+        get_webnode_apps_folder.cache_clear()
+        os.makedirs(app_folder, exist_ok=True)
 
-    # Download favicon
-    favicon_url = get_favicon_url(url)
-    download_favicon(favicon_url, icon_path)
+    # Fetch the favicon in the background; the script only needs icon_path,
+    # so it can be rendered and written while the network requests run.
+    favicon_job = _FETCH_POOL.submit(fetch_favicon, url, icon_path, folder)
 
     # url must be a string literal for QUrl
-    script = SCRIPT_TEMPLATE.format(
-        title=title.replace('"', '\\"'),
-        url=repr(url.strip()),
-        icon_path=icon_path.replace("\\", "\\\\").replace('"', '\\"')
-    )
-    with open(script_path, "w", encoding="utf-8") as f:
-        f.write(script)
-    return script_path
+    script = render_script(escape_title(title), repr(url.strip()), escape_path(icon_path))
+    write_atomic(script_path, script, mode="w", encoding="utf-8")
+    favicon_saved = favicon_job.result()
+    return script_path, favicon_saved
+
+# ---------------------------
+# Background Generation
+# ---------------------------
+
+class GenJobSignals(QtCore.QObject):
+    finished = QtCore.pyqtSignal(str, bool)
+    error = QtCore.pyqtSignal(str)
+
+class GenJob(QtCore.QRunnable):
+    # Runs generate_script on the thread pool; reports back through signals
+    def __init__(self, company, name, title, url, folder):
+        super().__init__()
+        self.args = (company, name, title, url, folder)
+        self.signals = GenJobSignals()
+
+    def run(self):
+        try:
+            script_path, favicon_saved = generate_script(*self.args)
+        except Exception as e:
+            self.signals.error.emit(str(e))
+        else:
+            self.signals.finished.emit(script_path, favicon_saved)
 
 # ---------------------------
 # Main Application Window
@@ -293,6 +550,11 @@ class MainWindow(QtWidgets.QWidget):
                 font-family: 'Roboto', Arial, sans-serif;
             }
         """)
+        # Coalesce bursts of keystrokes into a single preview render
+        self._preview_timer = QtCore.QTimer(self, singleShot=True, interval=120)
+        self._preview_timer.timeout.connect(self._do_update_preview)
+        self._last = {"title": None, "url": None, "icon_path": None}
+        self._cached_parts = {}
         self.init_ui()
 
     def init_ui(self):
@@ -389,9 +651,12 @@ class MainWindow(QtWidgets.QWidget):
         # Connect input changes to preview update
         for key in self.inputs:
             self.inputs[key].textChanged.connect(self.update_preview)
-        self.update_preview()
+        self._do_update_preview()
 
     def update_preview(self):
+        self._preview_timer.start()
+
+    def _do_update_preview(self):
         company = self.inputs["company"].text().strip()
         name = self.inputs["name"].text().strip()
         title = self.inputs["title"].text().strip()
@@ -399,16 +664,28 @@ class MainWindow(QtWidgets.QWidget):
         # Use dummy values if empty for preview
         preview_title = title if title else "App Title"
         preview_url = url if url else "https://example.com"
-        safe_company = sanitize_filename(company if company else "company")
-        safe_name = sanitize_filename(name if name else "name")
-        icon_path = os.path.join("app", f"{safe_company}.{safe_name}", f"webnode.{safe_company}.{safe_name}.ico")
-        # url must be a string literal for QUrl
-        script = SCRIPT_TEMPLATE.format(
-            title=preview_title.replace('"', '\\"'),
-            url=repr(preview_url),
-            icon_path=icon_path.replace("\\", "\\\\").replace('"', '\\"')
-        )
-        self.script_preview.setPlainText(script)
+        preview_app = (company if company else "company", name if name else "name")
+
+        # Only re-escape the fields whose input actually changed
+        changed = False
+        if preview_title != self._last["title"]:
+            self._last["title"] = preview_title
+            self._cached_parts["title"] = escape_title(preview_title)
+            changed = True
+        if preview_url != self._last["url"]:
+            self._last["url"] = preview_url
+            # url must be a string literal for QUrl
+            self._cached_parts["url"] = repr(preview_url)
+            changed = True
+        if preview_app != self._last["icon_path"]:
+            self._last["icon_path"] = preview_app
+            safe_company = sanitize_filename(preview_app[0])
+            safe_name = sanitize_filename(preview_app[1])
+            icon_path = os.path.join("app", f"{safe_company}.{safe_name}", f"webnode.{safe_company}.{safe_name}.ico")
+            self._cached_parts["icon_path"] = escape_path(icon_path)
+            changed = True
+        if changed:
+            self.script_preview.setPlainText(render_script(**self._cached_parts))
 
     def on_generate(self):
         company = self.inputs["company"].text().strip()
@@ -426,14 +703,29 @@ class MainWindow(QtWidgets.QWidget):
 
         folder = get_webnode_apps_folder()
         if not folder:
+            # Don't remember the miss; the folder may exist on the next try
+            get_webnode_apps_folder.cache_clear()
             self.status.setText("Could not locate a Documents folder.")
             return
 
-        try:
-            script_path = generate_script(company, name, title, url, folder)
-            self.status.setText(f"Script generated: {os.path.basename(script_path)}")
-        except Exception as e:
-            self.status.setText(f"Error: {e}")
+        # Network and disk work happen off the GUI thread
+        self.btn_generate.setEnabled(False)
+        self.status.setText("Generating...")
+        self._gen_job = GenJob(company, name, title, url, folder)
+        self._gen_job.signals.finished.connect(self.on_generate_finished)
+        self._gen_job.signals.error.connect(self.on_generate_error)
+        QtCore.QThreadPool.globalInstance().start(self._gen_job)
+
+    def on_generate_finished(self, script_path, favicon_saved):
+        message = f"Script generated: {os.path.basename(script_path)}"
+        if not favicon_saved:
+            message += " (favicon unavailable)"
+        self.status.setText(message)
+        self.btn_generate.setEnabled(True)
+
+    def on_generate_error(self, error):
+        self.status.setText(f"Error: {error}")
+        self.btn_generate.setEnabled(True)
 
 # ---------------------------
 # Main Entry Point
@@ -441,6 +733,7 @@ class MainWindow(QtWidgets.QWidget):
 
 def main():
     app = QtWidgets.QApplication(sys.argv)
+    app.aboutToQuit.connect(close_session)
     app.setStyle("Fusion")
     # Set dark palette
     palette = QtGui.QPalette()